@@ -4,10 +4,24 @@ ActiveCampaign MCP Server
 A FastMCP server that provides structured output tools for ActiveCampaign API endpoints.
 """
 
+import asyncio
+import atexit
+import functools
+import inspect
+import logging
 import os
-from typing import Dict, Any, Optional, List
-from pydantic import BaseModel
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Dict, Any, Optional, List, TypeVar, get_args, get_origin
+from pydantic import BaseModel, ConfigDict, ValidationError
+from pydantic_core import from_json, to_json
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import DecodeError, ProtocolError, ReadTimeoutError
+from urllib3.util.retry import Retry
 from mcp.server.fastmcp import FastMCP
 from dotenv import load_dotenv
 
@@ -16,87 +30,319 @@ load_dotenv(override=True)  # Load environment variables from .env file
 # Initialize FastMCP server
 mcp = FastMCP("ActiveCampaign API")
 
+logger = logging.getLogger(__name__)
+
+# Shared HTTP session so Nango and ActiveCampaign calls reuse pooled keep-alive connections
+_SESSION = requests.Session()
+_SESSION.headers.update({
+    "Content-Type": "application/json",
+    "Accept": "application/json"
+})
+# Longest wait honoured from a Retry-After header, so a single 429 cannot stall a tool call
+_RETRY_AFTER_MAX = 5.0
+
+class _CappedRetry(Retry):
+    """Retry policy that clamps server-sent Retry-After waits to _RETRY_AFTER_MAX seconds."""
+    def get_retry_after(self, response):
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, _RETRY_AFTER_MAX)
+
+_ADAPTER = HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=20,
+    # POST is not retried so a lost response never creates a duplicate record
+    max_retries=_CappedRetry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=[429, 502, 503, 504],
+        allowed_methods=frozenset(("HEAD", "GET", "PUT", "DELETE")),
+        respect_retry_after_header=True,
+        raise_on_status=False
+    )
+)
+_SESSION.mount("https://", _ADAPTER)
+_SESSION.mount("http://", _ADAPTER)
+atexit.register(_SESSION.close)
+
+_ALLOWED_METHODS = frozenset(("GET", "POST", "PUT", "DELETE"))
+# (connect, read) timeouts in seconds for ActiveCampaign requests, by longest endpoint prefix
+_CONNECT_TIMEOUT = 5
+_DEFAULT_TIMEOUT = (_CONNECT_TIMEOUT, 20)
+_ENDPOINT_TIMEOUTS = {
+    "/api/3/campaigns": (_CONNECT_TIMEOUT, 60),
+    "/api/3/deals": (_CONNECT_TIMEOUT, 60),
+    "/api/3/users": (_CONNECT_TIMEOUT, 15),
+    "/api/3/tags": (_CONNECT_TIMEOUT, 10),
+    "/api/3/lists": (_CONNECT_TIMEOUT, 10),
+}
+_TIMEOUT_PREFIXES = sorted(_ENDPOINT_TIMEOUTS.items(), key=lambda item: len(item[0]), reverse=True)
+
+# Worker threads used by bulk_read; bounded to stay within ActiveCampaign rate limits
+_BULK_POOL = ThreadPoolExecutor(max_workers=8)
+
+# Set AC_SKIP_VALIDATE=1 to trust ActiveCampaign list payloads and skip Pydantic validation
+FAST_CONSTRUCT = os.getenv("AC_SKIP_VALIDATE") == "1"
+
+# Nango credentials are reused for this many seconds before being fetched again
+_CRED_TTL = 300.0
+_CRED_CACHE: Dict[str, Any] = {"value": None, "expires_at": 0.0, "cfg": None}
+_CRED_LOCK = threading.Lock()
+
+# Bodies of cacheable GET responses keyed by endpoint, as (expires_at, body) in LRU order
+_GET_CACHE_TTL = 60.0
+_GET_CACHE_MAXSIZE = 512
+_GET_CACHE: "OrderedDict[str, tuple[float, bytes]]" = OrderedDict()
+_GET_CACHE_LOCK = threading.Lock()
+
+@dataclass(slots=True, frozen=True)
+class AcConfig:
+    """ActiveCampaign connection settings derived once per Nango credential refresh."""
+    api_url: str
+    api_key: str
+    headers: Dict[str, str]
+    connection_id: Optional[str]
+    hostname: str
+
+def _build_config(credentials: dict[str, Any]) -> AcConfig:
+    """Build the ActiveCampaign config from a Nango credentials response."""
+    # Extract API key
+    api_key = credentials.get("credentials", {}).get("apiKey")
+    if not api_key:
+        raise ValueError("API key not found in Nango credentials")
+    
+    # Extract hostname from connection config
+    hostname = credentials.get("connection_config", {}).get("hostname")
+    if not hostname:
+        raise ValueError("Hostname not found in Nango connection config")
+    
+    return AcConfig(
+        api_url=f"https://{hostname}".rstrip("/"),
+        api_key=api_key,
+        # Shared read-only; Content-Type and Accept are set on the session
+        headers={"Api-Token": api_key},
+        connection_id=credentials.get("connection_id"),
+        hostname=hostname
+    )
+
+@dataclass(slots=True, frozen=True)
+class NangoConfig:
+    """Nango connection endpoint, query parameters and auth headers."""
+    url: str
+    params: Dict[str, str]
+    headers: Dict[str, str]
+
+def _load_nango_config() -> Optional[NangoConfig]:
+    """Build the Nango config from environment variables, or None if any are missing."""
+    id = os.environ.get("NANGO_CONNECTION_ID")
+    integration_id = os.environ.get("NANGO_INTEGRATION_ID")
+    base_url = os.environ.get("NANGO_BASE_URL")
+    secret_key = os.environ.get("NANGO_SECRET_KEY")
+    
+    if not all([id, integration_id, base_url, secret_key]):
+        return None
+    
+    return NangoConfig(
+        url=f"{base_url}/connection/{id}",
+        params={
+            "provider_config_key": integration_id,
+            "refresh_token": "true",
+        },
+        headers={"Authorization": f"Bearer {secret_key}"}
+    )
+
+# Nango settings are read from the environment once, after .env has been loaded
+_NANGO = _load_nango_config()
+
 # Configuration - API URL will be extracted from Nango connection config
-def get_activecampaign_config() -> tuple[str, str]:
-    """Get ActiveCampaign API URL and key from Nango credentials."""
+def get_activecampaign_config() -> AcConfig:
+    """Get the ActiveCampaign config built from the cached Nango credentials."""
     try:
-        credentials = get_connection_credentials()
-        
-        # Extract API key
-        api_key = credentials.get("credentials", {}).get("apiKey")
-        if not api_key:
-            raise ValueError("API key not found in Nango credentials")
-        
-        # Extract hostname from connection config
-        hostname = credentials.get("connection_config", {}).get("hostname")
-        if not hostname:
-            raise ValueError("Hostname not found in Nango connection config")
-        
-        # Construct API URL
-        api_url = f"https://{hostname}"
-        
-        return api_url, api_key
+        get_connection_credentials()
     except Exception as e:
         raise ValueError(f"Failed to get ActiveCampaign config from Nango: {str(e)}")
+    return _CRED_CACHE["cfg"]
 
 def get_connection_credentials() -> dict[str, Any]:
-    """Get credentials from Nango"""
-    id = os.environ.get("NANGO_CONNECTION_ID")
-    integration_id = os.environ.get("NANGO_INTEGRATION_ID")
-    base_url = os.environ.get("NANGO_BASE_URL")
-    secret_key = os.environ.get("NANGO_SECRET_KEY")
+    """Get credentials from Nango, cached for _CRED_TTL seconds."""
+    if time.monotonic() < _CRED_CACHE["expires_at"]:
+        return _CRED_CACHE["value"]
     
-    if not all([id, integration_id, base_url, secret_key]):
+    with _CRED_LOCK:
+        # Another caller may have refreshed the cache while we waited for the lock
+        if time.monotonic() < _CRED_CACHE["expires_at"]:
+            return _CRED_CACHE["value"]
+        return _fetch_connection_credentials()
+
+def _fetch_connection_credentials() -> dict[str, Any]:
+    """Fetch credentials from Nango and store them in the credential cache."""
+    if _NANGO is None:
         raise ValueError("Missing required Nango environment variables")
     
-    url = f"{base_url}/connection/{id}"
-    params = {
-        "provider_config_key": integration_id,
-        "refresh_token": "true",
-    }
-    headers = {"Authorization": f"Bearer {secret_key}"}
-    
-    response = requests.get(url, headers=headers, params=params)
+    response = _SESSION.get(_NANGO.url, headers=_NANGO.headers, params=_NANGO.params, timeout=10)
     response.raise_for_status()  # Raise exception for bad status codes
     
-    return response.json()
+    credentials = from_json(response.content)
+    _CRED_CACHE["cfg"] = _build_config(credentials)
+    _CRED_CACHE["value"] = credentials
+    _CRED_CACHE["expires_at"] = time.monotonic() + _CRED_TTL
+    return credentials
+
+@dataclass(slots=True, frozen=True)
+class NangoInfo:
+    """Diagnostic summary of the Nango connection."""
+    connection_id: Optional[str] = None
+    provider: Optional[str] = None
+    hostname: Optional[str] = None
+    has_api_key: bool = False
+    last_fetched_at: Optional[str] = None
+
+def get_nango_connection_info() -> NangoInfo:
+    """Summarise the cached Nango credentials without exposing the API key."""
+    credentials = get_connection_credentials()
+    return NangoInfo(
+        connection_id=credentials.get("connection_id"),
+        provider=credentials.get("provider"),
+        hostname=credentials.get("connection_config", {}).get("hostname"),
+        has_api_key=bool(credentials.get("credentials", {}).get("apiKey")),
+        last_fetched_at=credentials.get("last_fetched_at")
+    )
 
 def get_headers() -> Dict[str, str]:
-    """Get headers for ActiveCampaign API requests using Nango credentials."""
-    _, api_key = get_activecampaign_config()
+    """Get per-request headers for ActiveCampaign API requests using Nango credentials.
+
+    Content-Type and Accept are set once on the shared session. The returned
+    dict is cached with the credentials and must not be modified.
+    """
+    return get_activecampaign_config().headers
+
+def _timeout_for(endpoint: str) -> tuple[int, int]:
+    """Pick the (connect, read) timeout for endpoint by its longest matching prefix."""
+    for prefix, timeout in _TIMEOUT_PREFIXES:
+        if endpoint.startswith(prefix):
+            return timeout
+    return _DEFAULT_TIMEOUT
+
+def _send_request(method: str, endpoint: str, data: Optional[Dict] = None) -> requests.Response:
+    """Send a request to ActiveCampaign API, raising for error responses.
+
+    method must be an upper-case HTTP verb from _ALLOWED_METHODS. The body is
+    left unread; use _read_body to load it.
+    """
+    if method not in _ALLOWED_METHODS:
+        raise ValueError(f"Unsupported HTTP method: {method}")
     
-    return {
-        "Api-Token": api_key,
-        "Content-Type": "application/json",
-        "Accept": "application/json"
-    }
-
-def make_request(method: str, endpoint: str, data: Optional[Dict] = None) -> Dict[str, Any]:
-    """Make a request to ActiveCampaign API."""
-    api_url, _ = get_activecampaign_config()
-    url = f"{api_url.rstrip('/')}{endpoint}"
-    headers = get_headers()
+    config = get_activecampaign_config()
+    url = f"{config.api_url}{endpoint}"
     
+    # Encode the body once with pydantic-core; the session already sends the JSON Content-Type
+    body = to_json(data) if data is not None else None
+    response = _SESSION.request(method, url, headers=config.headers, data=body,
+                                timeout=_timeout_for(endpoint), stream=True)
     try:
-        if method.upper() == "GET":
-            response = requests.get(url, headers=headers, timeout=30)
-        elif method.upper() == "POST":
-            response = requests.post(url, headers=headers, json=data, timeout=30)
-        elif method.upper() == "PUT":
-            response = requests.put(url, headers=headers, json=data, timeout=30)
-        elif method.upper() == "DELETE":
-            response = requests.delete(url, headers=headers, timeout=30)
-        else:
-            raise ValueError(f"Unsupported HTTP method: {method}")
-        
         response.raise_for_status()
-        return response.json()
+    except requests.exceptions.HTTPError:
+        response.close()
+        raise
+    return response
+
+def _read_body(response: requests.Response) -> bytes:
+    """Read a streamed response body with a single decoded read.
+
+    This skips requests' 10 KiB iter_content chunks and the join over them, so
+    large list payloads are held in memory once instead of twice while loading.
+    The connection returns to the pool once the body is fully read. urllib3
+    errors are re-raised as the requests exceptions iter_content would raise.
+    """
+    try:
+        return response.raw.read(decode_content=True)
+    except ProtocolError as e:
+        response.close()
+        raise requests.exceptions.ChunkedEncodingError(e, response=response)
+    except DecodeError as e:
+        response.close()
+        raise requests.exceptions.ContentDecodingError(e, response=response)
+    except ReadTimeoutError as e:
+        response.close()
+        raise requests.exceptions.ConnectionError(e, response=response)
+
+def _err(msg: str, code: Optional[int] = None) -> Dict[str, Any]:
+    """Build the error dict returned for a failed request."""
+    return {"error": msg, "status_code": code}
+
+def make_request(method: str, endpoint: str, data: Optional[Dict] = None) -> Dict[str, Any]:
+    """Make a request to ActiveCampaign API and decode the JSON body with pydantic-core."""
+    try:
+        content = _read_body(_send_request(method, endpoint, data))
     except requests.exceptions.RequestException as e:
-        return {"error": str(e), "status_code": getattr(e.response, 'status_code', None)}
+        resp = e.response
+        return _err(str(e), resp.status_code if resp is not None else None)
+    
+    try:
+        return from_json(content)
+    except ValueError as e:
+        return _err(f"Invalid JSON in response: {e}")
+
+def _get_cached(endpoint: str) -> Optional[bytes]:
+    """Return the cached body for endpoint, or None if missing or expired."""
+    with _GET_CACHE_LOCK:
+        entry = _GET_CACHE.get(endpoint)
+        if entry is None:
+            return None
+        if time.monotonic() >= entry[0]:
+            del _GET_CACHE[endpoint]
+            return None
+        _GET_CACHE.move_to_end(endpoint)
+        return entry[1]
+
+def _store_cached(endpoint: str, body: bytes) -> None:
+    """Cache a GET response body, evicting the least recently used entry when full."""
+    with _GET_CACHE_LOCK:
+        _GET_CACHE[endpoint] = (time.monotonic() + _GET_CACHE_TTL, body)
+        _GET_CACHE.move_to_end(endpoint)
+        if len(_GET_CACHE) > _GET_CACHE_MAXSIZE:
+            _GET_CACHE.popitem(last=False)
+
+def clear_get_cache() -> int:
+    """Drop all cached GET responses and return how many were removed."""
+    with _GET_CACHE_LOCK:
+        count = len(_GET_CACHE)
+        _GET_CACHE.clear()
+        return count
+
+def make_request_bytes(method: str, endpoint: str, data: Optional[Dict] = None,
+                       cached: bool = False) -> bytes:
+    """Make a request to ActiveCampaign API and return the raw JSON body.
+
+    Raises requests.exceptions.RequestException on failure. With cached=True,
+    successful GET bodies are reused for _GET_CACHE_TTL seconds; any
+    successful write clears the cache.
+    """
+    if cached:
+        body = _get_cached(endpoint)
+        if body is not None:
+            return body
+    
+    body = _read_body(_send_request(method, endpoint, data))
+    if method != "GET":
+        clear_get_cache()
+    elif cached:
+        _store_cached(endpoint, body)
+    return body
+
+async def make_request_bytes_async(method: str, endpoint: str, data: Optional[Dict] = None,
+                                   cached: bool = False) -> bytes:
+    """Run make_request_bytes in a worker thread so concurrent tool calls don't block the event loop."""
+    return await asyncio.to_thread(make_request_bytes, method, endpoint, data, cached)
 
 # Structured Output Models
 
-class ContactData(BaseModel):
+class ActiveCampaignModel(BaseModel):
+    """Base for response models: read-only instances that drop unknown API fields."""
+    model_config = ConfigDict(extra="ignore", frozen=True, validate_default=False, populate_by_name=True)
+
+class ContactData(ActiveCampaignModel):
     """Contact information structure."""
     cdate: Optional[str] = None
     email: Optional[str] = None
@@ -106,20 +352,20 @@ class ContactData(BaseModel):
     orgid: Optional[str] = None
     id: Optional[str] = None
 
-class ContactListData(BaseModel):
+class ContactListData(ActiveCampaignModel):
     """Contact list information structure."""
     contact: Optional[str] = None
     list: Optional[str] = None
     status: Optional[int] = None
     id: Optional[str] = None
 
-class ContactResponse(BaseModel):
+class ContactResponse(ActiveCampaignModel):
     """Response structure for contact operations."""
     contacts: Optional[List[ContactData]] = None
     contactList: Optional[ContactListData] = None
     error: Optional[str] = None
 
-class CampaignData(BaseModel):
+class CampaignData(ActiveCampaignModel):
     """Campaign information structure."""
     type: Optional[str] = None
     name: Optional[str] = None
@@ -128,27 +374,27 @@ class CampaignData(BaseModel):
     mdate: Optional[str] = None
     id: Optional[str] = None
 
-class CampaignResponse(BaseModel):
+class CampaignResponse(ActiveCampaignModel):
     """Response structure for campaign operations."""
     campaign: Optional[CampaignData] = None
     campaigns: Optional[List[CampaignData]] = None
     meta: Optional[Dict[str, Any]] = None
     error: Optional[str] = None
 
-class ListData(BaseModel):
+class ListData(ActiveCampaignModel):
     """List information structure."""
     name: Optional[str] = None
     stringid: Optional[str] = None
     cdate: Optional[str] = None
     id: Optional[str] = None
 
-class ListResponse(BaseModel):
+class ListResponse(ActiveCampaignModel):
     """Response structure for list operations."""
     list: Optional[ListData] = None
     lists: Optional[List[ListData]] = None
     error: Optional[str] = None
 
-class DealData(BaseModel):
+class DealData(ActiveCampaignModel):
     """Deal information structure."""
     title: Optional[str] = None
     value: Optional[str] = None
@@ -156,44 +402,44 @@ class DealData(BaseModel):
     status: Optional[str] = None
     id: Optional[str] = None
 
-class DealResponse(BaseModel):
+class DealResponse(ActiveCampaignModel):
     """Response structure for deal operations."""
     deal: Optional[DealData] = None
     deals: Optional[List[DealData]] = None
     error: Optional[str] = None
 
-class AccountData(BaseModel):
+class AccountData(ActiveCampaignModel):
     """Account information structure."""
     name: Optional[str] = None
     accountUrl: Optional[str] = None
     id: Optional[str] = None
 
-class NoteData(BaseModel):
+class NoteData(ActiveCampaignModel):
     """Note information structure."""
     note: Optional[str] = None
     cdate: Optional[str] = None
     id: Optional[str] = None
 
-class AccountResponse(BaseModel):
+class AccountResponse(ActiveCampaignModel):
     """Response structure for account operations."""
     accounts: Optional[List[AccountData]] = None
     note: Optional[NoteData] = None
     error: Optional[str] = None
 
-class TagData(BaseModel):
+class TagData(ActiveCampaignModel):
     """Tag information structure."""
     tag: Optional[str] = None
     tagType: Optional[str] = None
     description: Optional[str] = None
     id: Optional[str] = None
 
-class TagResponse(BaseModel):
+class TagResponse(ActiveCampaignModel):
     """Response structure for tag operations."""
     tag: Optional[TagData] = None
     tags: Optional[List[TagData]] = None
     error: Optional[str] = None
 
-class MessageData(BaseModel):
+class MessageData(ActiveCampaignModel):
     """Message information structure."""
     name: Optional[str] = None
     subject: Optional[str] = None
@@ -201,13 +447,13 @@ class MessageData(BaseModel):
     fromemail: Optional[str] = None
     id: Optional[str] = None
 
-class MessageResponse(BaseModel):
+class MessageResponse(ActiveCampaignModel):
     """Response structure for message operations."""
     message: Optional[MessageData] = None
     messages: Optional[List[MessageData]] = None
     error: Optional[str] = None
 
-class UserData(BaseModel):
+class UserData(ActiveCampaignModel):
     """User information structure."""
     username: Optional[str] = None
     email: Optional[str] = None
@@ -215,56 +461,191 @@ class UserData(BaseModel):
     lastName: Optional[str] = None
     id: Optional[str] = None
 
-class UserResponse(BaseModel):
+class UserResponse(ActiveCampaignModel):
     """Response structure for user operations."""
     user: Optional[UserData] = None
     users: Optional[List[UserData]] = None
     error: Optional[str] = None
 
-class PipelineData(BaseModel):
+class PipelineData(ActiveCampaignModel):
     """Pipeline information structure."""
     title: Optional[str] = None
     currency: Optional[str] = None
     id: Optional[str] = None
 
-class PipelineResponse(BaseModel):
+class PipelineResponse(ActiveCampaignModel):
     """Response structure for pipeline operations."""
     pipeline: Optional[PipelineData] = None
     pipelines: Optional[List[PipelineData]] = None
     error: Optional[str] = None
 
-class FieldValueData(BaseModel):
+class FieldValueData(ActiveCampaignModel):
     """Field value information structure."""
     contact: Optional[str] = None
     field: Optional[str] = None
     value: Optional[str] = None
     id: Optional[str] = None
 
-class FieldValueResponse(BaseModel):
+class FieldValueResponse(ActiveCampaignModel):
     """Response structure for field value operations."""
     fieldValue: Optional[FieldValueData] = None
     fieldValues: Optional[List[FieldValueData]] = None
     error: Optional[str] = None
 
-class AutomationData(BaseModel):
+class AutomationData(ActiveCampaignModel):
     """Automation information structure."""
     name: Optional[str] = None
     status: Optional[str] = None
     entered: Optional[str] = None
     id: Optional[str] = None
 
-class AutomationResponse(BaseModel):
+class AutomationResponse(ActiveCampaignModel):
     """Response structure for automation operations."""
     automation: Optional[AutomationData] = None
     automations: Optional[List[AutomationData]] = None
     error: Optional[str] = None
 
+ResponseT = TypeVar("ResponseT", bound=BaseModel)
+
+@functools.lru_cache(maxsize=None)
+def _nested_models(model: type[BaseModel]) -> Dict[str, tuple[type[BaseModel], bool]]:
+    """Map each field of model holding a model (or a list of them) to (item model, is_list)."""
+    nested = {}
+    for name, field in model.model_fields.items():
+        # Fields are Optional[...]; look inside the union for the model or List[model]
+        for arg in get_args(field.annotation) or (field.annotation,):
+            many = get_origin(arg) is list
+            item = get_args(arg)[0] if many else arg
+            if isinstance(item, type) and issubclass(item, BaseModel):
+                nested[name] = (item, many)
+    return nested
+
+def _construct(model: type[ResponseT], data: Dict[str, Any]) -> ResponseT:
+    """Build model from trusted data without validation, constructing nested models too.
+
+    Unknown keys are dropped at every level, so the result serialises to the
+    model's schema as long as the API sends the declared value types.
+    """
+    values = dict(data)
+    for name, (item_model, many) in _nested_models(model).items():
+        value = values.get(name)
+        if many and isinstance(value, list):
+            values[name] = [_construct(item_model, item) for item in value]
+        elif not many and isinstance(value, dict):
+            values[name] = _construct(item_model, value)
+    return model.model_construct(**values)
+
+async def fetch_model(endpoint: str, model: type[ResponseT], method: str = "GET",
+                      data: Optional[Dict] = None, trusted: bool = False,
+                      cached: bool = False) -> ResponseT:
+    """Call ActiveCampaign API and build the response model from the raw JSON body.
+
+    Trusted (list endpoint) responses skip validation when FAST_CONSTRUCT is set
+    and are built with _construct instead.
+    Cached GET responses are served from the in-process TTL cache. Failed
+    requests and bodies that are not JSON return the model with only its
+    error field set, unvalidated.
+    """
+    try:
+        payload = await make_request_bytes_async(method, endpoint, data, cached)
+    except requests.exceptions.RequestException as e:
+        return model.model_construct(error=str(e))
+    if trusted and FAST_CONSTRUCT:
+        try:
+            return _construct(model, from_json(payload))
+        except ValueError as e:
+            return model.model_construct(error=f"Invalid JSON in response: {e}")
+    try:
+        return model.model_validate_json(payload)
+    except ValidationError as e:
+        invalid = next((err for err in e.errors() if err["type"] == "json_invalid"), None)
+        if invalid is None:
+            raise
+        return model.model_construct(error=f"Invalid JSON in response: {invalid['ctx']['error']}")
+
+# Endpoint templates for single-resource tools, filled with %-formatting
+_CONTACT_LISTS_URL = "/api/3/contacts/%s/contactLists"
+_FIELD_URL = "/api/3/fields/%s"
+_LIST_URL = "/api/3/lists/%s"
+_DEAL_URL = "/api/3/deals/%s"
+_TAG_URL = "/api/3/tags/%s"
+_CAMPAIGN_URL = "/api/3/campaigns/%s"
+_PIPELINE_URL = "/api/3/dealGroups/%s"
+_MESSAGE_URL = "/api/3/messages/%s"
+
+@dataclass(slots=True, frozen=True)
+class ReadTool:
+    """Declarative spec for a GET tool registered through _make_read_tool."""
+    name: str
+    description: str
+    endpoint: str
+    model: type[BaseModel]
+    params: tuple[str, ...] = ()
+    trusted: bool = False
+    cached: bool = False
+
+def _make_read_tool(spec: ReadTool) -> Callable[..., Any]:
+    """Build the async tool function for spec, with a signature FastMCP can introspect."""
+    signature = inspect.Signature(
+        [inspect.Parameter(p, inspect.Parameter.POSITIONAL_OR_KEYWORD, annotation=str) for p in spec.params],
+        return_annotation=spec.model
+    )
+    
+    async def tool(*args: str, **kwargs: str) -> BaseModel:
+        # Arguments come back in signature order, matching the endpoint template
+        arguments = signature.bind(*args, **kwargs).arguments
+        endpoint = spec.endpoint % tuple(arguments.values()) if spec.params else spec.endpoint
+        return await fetch_model(endpoint, spec.model, trusted=spec.trusted, cached=spec.cached)
+    
+    tool.__name__ = tool.__qualname__ = spec.name
+    tool.__doc__ = spec.description
+    tool.__signature__ = signature
+    return tool
+
+_READ_TOOLS = (
+    # Contact Tools
+    ReadTool("get_custom_field_contact", "Retrieve a custom field for contacts.",
+             _FIELD_URL, FieldValueResponse, ("field_id",)),
+    # List Tools
+    ReadTool("get_list", "Retrieve a specific list.",
+             _LIST_URL, ListResponse, ("list_id",), cached=True),
+    ReadTool("list_campaigns", "Retrieve all existing campaigns.",
+             "/api/3/campaigns", CampaignResponse, trusted=True),
+    ReadTool("list_automations", "Retrieve all existing automations.",
+             "/api/3/automations", AutomationResponse, trusted=True, cached=True),
+    ReadTool("list_users", "List all existing users.",
+             "/api/3/users", UserResponse, trusted=True, cached=True),
+    ReadTool("list_pipelines", "Retrieve all existing pipelines.",
+             "/api/3/dealGroups", PipelineResponse, trusted=True, cached=True),
+    ReadTool("list_messages", "Retrieve all existing messages.",
+             "/api/3/messages", MessageResponse, trusted=True),
+    # Deal Tools
+    ReadTool("get_deal", "Retrieve an existing deal.",
+             _DEAL_URL, DealResponse, ("deal_id",), cached=True),
+    ReadTool("list_deals", "Retrieve all existing deals.",
+             "/api/3/deals", DealResponse, trusted=True),
+    # Tag Tools
+    ReadTool("get_tag", "Retrieve a specific tag.",
+             _TAG_URL, TagResponse, ("tag_id",), cached=True),
+    # Campaign Tools
+    ReadTool("get_campaign", "Retrieve a specific campaign.",
+             _CAMPAIGN_URL, CampaignResponse, ("campaign_id",), cached=True),
+    ReadTool("get_pipeline", "Retrieve an existing pipeline.",
+             _PIPELINE_URL, PipelineResponse, ("pipeline_id",), cached=True),
+    ReadTool("get_message", "Retrieve a specific message.",
+             _MESSAGE_URL, MessageResponse, ("message_id",), cached=True),
+)
+
+for _spec in _READ_TOOLS:
+    globals()[_spec.name] = mcp.tool(name=_spec.name, description=_spec.description)(_make_read_tool(_spec))
+del _spec
+
 # Contact Tools
 
 @mcp.tool()
-def update_list_status_for_contact(contact_id: str, list_id: str, status: int = 1) -> ContactResponse:
+async def update_list_status_for_contact(contact_id: str, list_id: str, status: int = 1) -> ContactResponse:
     """Subscribe a contact to a list or unsubscribe a contact from a list."""
-    endpoint = f"/api/3/contacts/{contact_id}/contactLists"
+    endpoint = _CONTACT_LISTS_URL % contact_id
     data = {
         "contactList": {
             "list": list_id,
@@ -272,87 +653,19 @@ def update_list_status_for_contact(contact_id: str, list_id: str, status: int =
             "status": status
         }
     }
-    result = make_request("POST", endpoint, data)
-    return ContactResponse(**result)
-
-@mcp.tool()
-def get_custom_field_contact(field_id: str) -> FieldValueResponse:
-    """Retrieve a custom field for contacts."""
-    endpoint = f"/api/3/fields/{field_id}"
-    result = make_request("GET", endpoint)
-    return FieldValueResponse(**result)
+    return await fetch_model(endpoint, ContactResponse, "POST", data)
 
 # List Tools
 
 @mcp.tool()
-def list_custom_field_values(field_id: str) -> FieldValueResponse:
+async def list_custom_field_values(field_id: str) -> FieldValueResponse:
     """List all custom field values."""
-    endpoint = f"/api/3/fieldValues"
-    result = make_request("GET", endpoint)
-    return FieldValueResponse(**result)
-
-@mcp.tool()
-def get_list(list_id: str) -> ListResponse:
-    """Retrieve a specific list."""
-    endpoint = f"/api/3/lists/{list_id}"
-    result = make_request("GET", endpoint)
-    return ListResponse(**result)
-
-@mcp.tool()
-def list_campaigns() -> CampaignResponse:
-    """Retrieve all existing campaigns."""
-    endpoint = "/api/3/campaigns"
-    result = make_request("GET", endpoint)
-    return CampaignResponse(**result)
-
-@mcp.tool()
-def list_automations() -> AutomationResponse:
-    """Retrieve all existing automations."""
-    endpoint = "/api/3/automations"
-    result = make_request("GET", endpoint)
-    return AutomationResponse(**result)
-
-@mcp.tool()
-def list_users() -> UserResponse:
-    """List all existing users."""
-    endpoint = "/api/3/users"
-    result = make_request("GET", endpoint)
-    return UserResponse(**result)
-
-@mcp.tool()
-def list_pipelines() -> PipelineResponse:
-    """Retrieve all existing pipelines."""
-    endpoint = "/api/3/dealGroups"
-    result = make_request("GET", endpoint)
-    return PipelineResponse(**result)
-
-@mcp.tool()
-def list_messages() -> MessageResponse:
-    """Retrieve all existing messages."""
-    endpoint = "/api/3/messages"
-    result = make_request("GET", endpoint)
-    return MessageResponse(**result)
-
-# Deal Tools
-
-@mcp.tool()
-def get_deal(deal_id: str) -> DealResponse:
-    """Retrieve an existing deal."""
-    endpoint = f"/api/3/deals/{deal_id}"
-    result = make_request("GET", endpoint)
-    return DealResponse(**result)
-
-@mcp.tool()
-def list_deals() -> DealResponse:
-    """Retrieve all existing deals."""
-    endpoint = "/api/3/deals"
-    result = make_request("GET", endpoint)
-    return DealResponse(**result)
+    return await fetch_model(f"/api/3/fieldValues", FieldValueResponse, trusted=True)
 
 # Account Tools
 
 @mcp.tool()
-def create_an_account_note(account_id: str, note_text: str) -> AccountResponse:
+async def create_an_account_note(account_id: str, note_text: str) -> AccountResponse:
     """Create a new note for an account."""
     endpoint = f"/api/3/notes"
     data = {
@@ -362,61 +675,66 @@ def create_an_account_note(account_id: str, note_text: str) -> AccountResponse:
             "reltype": "account"
         }
     }
-    result = make_request("POST", endpoint, data)
-    return AccountResponse(**result)
+    return await fetch_model(endpoint, AccountResponse, "POST", data)
 
-# Tag Tools
+# Message Tools
 
 @mcp.tool()
-def get_tag(tag_id: str) -> TagResponse:
-    """Retrieve a specific tag."""
-    endpoint = f"/api/3/tags/{tag_id}"
-    result = make_request("GET", endpoint)
-    return TagResponse(**result)
+async def update_message(message_id: str, name: Optional[str] = None, subject: Optional[str] = None, 
+                        fromname: Optional[str] = None, fromemail: Optional[str] = None) -> MessageResponse:
+    """Update an existing message."""
+    endpoint = _MESSAGE_URL % message_id
+    fields = (("name", name), ("subject", subject), ("fromname", fromname), ("fromemail", fromemail))
+    data = {"message": {key: value for key, value in fields if value is not None}}
+    
+    return await fetch_model(endpoint, MessageResponse, "PUT", data)
 
-# Campaign Tools
+# Cache Tools
 
 @mcp.tool()
-def get_campaign(campaign_id: str) -> CampaignResponse:
-    """Retrieve a specific campaign."""
-    endpoint = f"/api/3/campaigns/{campaign_id}"
-    result = make_request("GET", endpoint)
-    return CampaignResponse(**result)
+async def invalidate_cache() -> Dict[str, int]:
+    """Clear cached responses so the next read fetches fresh data from ActiveCampaign."""
+    return {"cleared": clear_get_cache()}
 
-@mcp.tool()
-def get_pipeline(pipeline_id: str) -> PipelineResponse:
-    """Retrieve an existing pipeline."""
-    endpoint = f"/api/3/dealGroups/{pipeline_id}"
-    result = make_request("GET", endpoint)
-    return PipelineResponse(**result)
+# Bulk Tools
 
-@mcp.tool()
-def update_message(message_id: str, name: Optional[str] = None, subject: Optional[str] = None, 
-                  fromname: Optional[str] = None, fromemail: Optional[str] = None) -> MessageResponse:
-    """Update an existing message."""
-    endpoint = f"/api/3/messages/{message_id}"
-    data = {"message": {}}
-    
-    if name is not None:
-        data["message"]["name"] = name
-    if subject is not None:
-        data["message"]["subject"] = subject
-    if fromname is not None:
-        data["message"]["fromname"] = fromname
-    if fromemail is not None:
-        data["message"]["fromemail"] = fromemail
-    
-    result = make_request("PUT", endpoint, data)
-    return MessageResponse(**result)
+_BULK_READ_ENDPOINTS = frozenset((
+    "/api/3/campaigns",
+    "/api/3/users",
+    "/api/3/dealGroups",
+    "/api/3/deals",
+    "/api/3/messages",
+    "/api/3/automations",
+))
 
 @mcp.tool()
-def get_message(message_id: str) -> MessageResponse:
-    """Retrieve a specific message."""
-    endpoint = f"/api/3/messages/{message_id}"
-    result = make_request("GET", endpoint)
-    return MessageResponse(**result)
+async def bulk_read(endpoints: List[str]) -> Dict[str, Dict[str, Any]]:
+    """Fetch several list endpoints concurrently, keyed by endpoint.
+
+    Supported endpoints: /api/3/campaigns, /api/3/users, /api/3/dealGroups,
+    /api/3/deals, /api/3/messages and /api/3/automations.
+    """
+    loop = asyncio.get_running_loop()
+    futures = {}
+    for endpoint in dict.fromkeys(endpoints):
+        if endpoint in _BULK_READ_ENDPOINTS:
+            futures[endpoint] = loop.run_in_executor(_BULK_POOL, make_request, "GET", endpoint)
+    results = dict(zip(futures, await asyncio.gather(*futures.values())))
+    return {
+        endpoint: results[endpoint] if endpoint in results else _err(f"Unsupported endpoint: {endpoint}")
+        for endpoint in endpoints
+    }
 
 
+def _warm_connections() -> None:
+    """Open the Nango and ActiveCampaign connections ahead of the first tool call."""
+    try:
+        # Fetching the config fills the credential cache over the pooled session
+        config = get_activecampaign_config()
+        _SESSION.head(f"{config.api_url}/api/3/users", headers=config.headers, timeout=5)
+    except Exception as e:
+        logger.debug("Connection warm-up failed: %s", e)
+
 def run():
     # Check environment variables for Nango
     required_nango_vars = [
@@ -428,20 +746,26 @@ def run():
     
     missing_vars = [var for var in required_nango_vars if not os.getenv(var)]
     if missing_vars:
-        print(f"Warning: Missing Nango environment variables: {', '.join(missing_vars)}")
+        logger.warning("Missing Nango environment variables: %s", ", ".join(missing_vars))
     
-    # Test Nango connection at startup
-    try:
-        credentials = get_connection_credentials()
-        api_url, api_key = get_activecampaign_config()
-        print(f"✓ Successfully connected to Nango")
-        print(f"  - Connection ID: {credentials.get('connection_id')}")
-        print(f"  - Provider: {credentials.get('provider')}")
-        print(f"  - Hostname: {credentials.get('connection_config', {}).get('hostname')}")
-        print(f"  - API URL: {api_url}")
-        print(f"  - Last fetched: {credentials.get('last_fetched_at')}")
-    except Exception as e:
-        print(f"✗ Failed to connect to Nango: {e}")
+    # Credentials are fetched lazily by the first tool call; AC_MCP_DEBUG=1 probes Nango at startup
+    if os.getenv("AC_MCP_DEBUG") == "1":
+        logger.setLevel(logging.DEBUG)
+        try:
+            info = get_nango_connection_info()
+            config = get_activecampaign_config()
+            logger.debug("Successfully connected to Nango")
+            logger.debug("  - Connection ID: %s", info.connection_id)
+            logger.debug("  - Provider: %s", info.provider)
+            logger.debug("  - Hostname: %s", info.hostname)
+            logger.debug("  - API URL: %s", config.api_url)
+            logger.debug("  - Last fetched: %s", info.last_fetched_at)
+        except Exception as e:
+            logger.debug("Failed to connect to Nango: %s", e)
+    
+    # Handshake with Nango and ActiveCampaign in the background; AC_MCP_WARMUP=0 disables this
+    if not missing_vars and os.getenv("AC_MCP_WARMUP") != "0":
+        threading.Thread(target=_warm_connections, name="ac-warmup", daemon=True).start()
     
     # Run the server
     mcp.run(transport="stdio")
\ No newline at end of file